@@ -1,10 +1,192 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import hashlib
-import mimetypes
 from urllib.parse import urlparse
 from pathlib import Path
 import time
+import threading
+import sqlite3
+import uuid
+import mmap
+import itertools
+import asyncio
+import select
+import socket
+import ssl
+import http.client
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
+try:
+    import aiohttp  # Optional: only needed for fetch_many
+except ImportError:
+    aiohttp = None
+
+try:
+    import fcntl  # POSIX only: part-file locks and a larger splice pipe
+except ImportError:
+    fcntl = None
+
+MAX_IMAGE_SIZE = 50 * 1024 * 1024  # 50MB limit (Ubuntu: Respect)
+
+# (connect, read) timeouts in seconds, shared by every request path
+REQUEST_TIMEOUT = (5, 30)
+
+# Longest we will sleep on a server's Retry-After while holding a worker and host slot
+MAX_RETRY_AFTER = 10
+
+# Zero-copy socket -> file downloads for plain HTTP (Linux, Python 3.10+)
+SPLICE_SUPPORTED = hasattr(os, 'splice') and hasattr(select, 'poll')
+
+# Cache of known digests, kept inside the image directory
+HASH_INDEX_NAME = '.hash_index.sqlite'
+HASH_INDEX_VERSION = 3
+
+# Content-addressed store: .objects/<first two hex chars>/<digest>, hard-linked
+# to the human-friendly filename the user browses
+OBJECTS_DIR_NAME = '.objects'
+
+# Temporary download files: .<uuid4 hex>.part. A crashed run's leftovers pin their
+# object in the store, so startup removes them. Live ones are flocked (POSIX) or
+# open (Windows refuses to delete them); the age also spares one that was just
+# closed to be moved into place.
+PART_NAME = re.compile(r'\.[0-9a-f]{32}\.part')
+STALE_PART_AGE = 2 * REQUEST_TIMEOUT[1]
+
+# Image formats we are willing to save (Ubuntu: Respect & Security)
+SAFE_CONTENT_TYPES = frozenset({
+    'image/jpeg', 'image/jpg', 'image/png', 'image/gif',
+    'image/webp', 'image/bmp', 'image/svg+xml'
+})
+
+# Canonical extension for each accepted type (no mimetypes database to load)
+CONTENT_TYPE_EXTENSIONS = {
+    'image/jpeg': '.jpg', 'image/jpg': '.jpg', 'image/png': '.png',
+    'image/gif': '.gif', 'image/webp': '.webp', 'image/bmp': '.bmp',
+    'image/svg+xml': '.svg',
+}
+
+# Failure messages shared by the threaded and asyncio fetch paths
+TOO_LARGE_MESSAGE = "❌ File too large. Respecting bandwidth limits."
+TIMEOUT_MESSAGE = "⏱️  Connection timeout. Server may be busy - respecting their resources."
+CONNECTION_MESSAGE = "🔌 Connection failed. Network or server unavailable."
+HTTP_ERROR_MESSAGE = "🚫 HTTP Error {}: Server declined request."
+NETWORK_ERROR_MESSAGE = "🌐 Network error: {}"
+UNEXPECTED_ERROR_MESSAGE = "❌ Unexpected error: {}"
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After, but never sleeps longer than MAX_RETRY_AFTER"""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+@lru_cache(maxsize=4096)
+def _parse_url(url):
+    """
+    Per-URL invariants, parsed once however many times a fetch asks
+    Returns: (parsed URL, filename stem, extension) - stem and extension are '' without a dot
+    """
+    parsed = urlparse(url)
+    filename = os.path.basename(parsed.path)
+    if '.' not in filename:
+        return parsed, '', ''
+    stem, extension = os.path.splitext(filename)
+    return parsed, stem, extension
+
+
+def _chunk_size(content_length):
+    """Read size scaled to the body: ~64 reads per file, between 64KB and 1MB"""
+    length = int(content_length or 0)
+    if not length:
+        return 64 * 1024
+    return min(1024 * 1024, max(64 * 1024, length // 64))
+
+
+def _new_hasher():
+    """Content fingerprint used for duplicate detection (SHA-NI accelerated where available)"""
+    return hashlib.sha256()
+
+
+def _digest(hasher):
+    """Raw 128-bit digest - plenty for dedup, smaller and cheaper to compare than hex"""
+    return hasher.digest()[:16]
+
+
+def _hash_file(path):
+    """Hash a file through a read-only memory map, avoiding a userland copy"""
+    hasher = _new_hasher()
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:  # Empty files cannot be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if size > 64 * 1024 * 1024 and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                hasher.update(mapped)
+    return _digest(hasher)
+
+
+def _remove_abandoned_part(path):
+    """Delete a crashed run's part file, leaving any download still writing it alone"""
+    if fcntl is None:
+        os.remove(path)  # Fails if another process still has the file open
+        return
+    with open(path, 'rb') as part:
+        try:
+            fcntl.flock(part.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return  # Held by a live download
+        os.remove(path)
+
+
+class _PartialDownload:
+    """A hidden .part file in the image directory, hashed as it is written"""
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, f".{uuid.uuid4().hex}.part")
+        self.file = open(self.path, 'xb')
+        if fcntl is not None:
+            # Held until close, so startup sweeps in other processes skip this file
+            try:
+                fcntl.flock(self.file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                pass  # No locks on this filesystem; sweeps there leave the file alone too
+        self.hasher = _new_hasher()
+        self.size = 0
+
+    def write(self, data):
+        """Hash and write a chunk; returns False once the download passes MAX_IMAGE_SIZE"""
+        self.size += len(data)
+        if self.size > MAX_IMAGE_SIZE:
+            return False
+        self.hasher.update(data)
+        self.file.write(data)
+        return True
+
+    def spliced(self, size):
+        """The body bypassed Python; finish() hashes it back from the page cache"""
+        self.size = size
+        self.hasher = None
+
+    def finish(self):
+        """Close the file and return its digest"""
+        self.file.close()
+        return _digest(self.hasher) if self.hasher else _hash_file(self.path)
+
+    def discard(self):
+        """Close and delete the file, unless it has already been moved into place"""
+        self.file.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
 
 
 class UbuntuImageFetcher:
@@ -17,48 +199,210 @@ class UbuntuImageFetcher:
     - Sharing: Organize images for later appreciation and sharing
     """
 
-    def __init__(self, directory="Fetched_Images"):
+    def __init__(self, directory="Fetched_Images", max_workers=16):
         self.directory = directory
+        self.max_workers = max_workers
         self.session = requests.Session()
+        # Keep connections alive for all workers and retry busy servers politely
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=_CappedRetry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         # Set a respectful User-Agent
         self.session.headers.update({
             'User-Agent': 'Ubuntu-Image-Fetcher/1.0 (Educational-Purpose)'
         })
         self.downloaded_hashes = set()
+        self.objects_directory = os.path.join(directory, OBJECTS_DIR_NAME)
+        self._lock = threading.Lock()
+
+        # Per-host politeness: at most 2 requests in flight, 0.5s apart
+        self.max_per_host = 2
+        self.host_interval = 0.5
+        self._host_slots = {}
+        self._host_next_request = {}
+
+        # Large images from range-capable servers download as parallel chunks
+        self.range_threshold = 4 * 1024 * 1024
+        self.range_parts = 4
+
+        # Create directory once (Ubuntu: Organization)
+        os.makedirs(self.directory, exist_ok=True)
         self._load_existing_hashes()
 
-    def _load_existing_hashes(self):
-        """Load hashes of existing images to prevent duplicates (Ubuntu: Sharing wisely)"""
-        if os.path.exists(self.directory):
-            for filename in os.listdir(self.directory):
-                filepath = os.path.join(self.directory, filename)
-                if os.path.isfile(filepath):
+    def _open_hash_index(self):
+        """Open the digest cache, or return None if it is unusable"""
+        try:
+            index = sqlite3.connect(
+                os.path.join(self.directory, HASH_INDEX_NAME))
+        except sqlite3.Error:
+            return None
+        try:
+            if index.execute('PRAGMA user_version').fetchone()[0] != HASH_INDEX_VERSION:
+                with index:
+                    index.execute('DROP TABLE IF EXISTS hashes')
+                    index.execute(
+                        'CREATE TABLE hashes (path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, digest BLOB)')
+                    index.execute(f'PRAGMA user_version = {HASH_INDEX_VERSION}')
+            return index
+        except sqlite3.Error:
+            index.close()
+            return None
+
+    def _object_path(self, content_hash):
+        """Location of an image in the content-addressed store"""
+        name = content_hash.hex()
+        return os.path.join(self.objects_directory, name[:2], name)
+
+    def _load_object_store(self):
+        """
+        Collect digests from the content-addressed store - names only, no file reads
+        Objects whose friendly copy was deleted are dropped so the image can be fetched again.
+        """
+        digests = []
+        try:
+            with os.scandir(self.objects_directory) as entries:
+                shards = [entry.path for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            return digests
+        for shard_path in shards:
+            with os.scandir(shard_path) as entries:
+                for entry in entries:
                     try:
-                        with open(filepath, 'rb') as f:
-                            file_hash = hashlib.md5(f.read()).hexdigest()
-                            self.downloaded_hashes.add(file_hash)
-                    except Exception:
+                        digest = bytes.fromhex(entry.name)
+                        # os.stat, not entry.stat(): DirEntry reports st_nlink as 0 on Windows
+                        if os.stat(entry.path).st_nlink < 2:
+                            os.remove(entry.path)
+                            continue
+                    except (OSError, ValueError):
                         continue  # Skip problematic files gracefully
+                    digests.append(digest)
+        return digests
+
+    def _load_existing_hashes(self):
+        """
+        Load hashes of existing images to prevent duplicates (Ubuntu: Sharing wisely)
+        Unchanged files reuse the digest cached in the sqlite index instead of being re-read.
+        """
+        index = self._open_hash_index()
+        cached = {}
+        if index is not None:
+            try:
+                cached = {path: (size, mtime, digest) for path, size, mtime, digest
+                          in index.execute('SELECT path, size, mtime, digest FROM hashes')}
+            except sqlite3.Error:
+                pass
+
+        # Sweep crashed downloads first: their extra link keeps an object alive
+        files = []
+        stale_before = time.time() - STALE_PART_AGE
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    if entry.name.startswith('.'):
+                        if PART_NAME.fullmatch(entry.name) and stat.st_mtime < stale_before:
+                            _remove_abandoned_part(entry.path)
+                        continue  # Our own index and temporary files
+                    files.append((entry, stat))
+                except OSError:
+                    continue  # Skip problematic files gracefully
+        self.downloaded_hashes.update(self._load_object_store())
+
+        known = []
+        pending = []
+        updated = []
+        for entry, stat in files:
+            row = cached.get(entry.name)
+            if row and row[:2] == (stat.st_size, stat.st_mtime_ns):
+                known.append((entry.name, row[2]))
+            else:
+                pending.append(
+                    (entry.name, entry.path, stat.st_size, stat.st_mtime_ns))
+
+        # Hash new or changed files in parallel; hashlib releases the GIL while hashing
+        if pending:
+            def hash_or_skip(path):
+                try:
+                    return _hash_file(path)
+                except (OSError, ValueError):
+                    return None  # Skip problematic files gracefully
+
+            with ThreadPoolExecutor() as executor:
+                digests = executor.map(
+                    hash_or_skip, [path for _, path, _, _ in pending])
+                for (name, _, size, mtime), file_hash in zip(pending, digests):
+                    if file_hash is not None:
+                        known.append((name, file_hash))
+                        updated.append((name, size, mtime, file_hash))
+
+        seen = set()
+        for name, file_hash in known:
+            seen.add(name)
+            self.downloaded_hashes.add(file_hash)
+
+        if index is not None:
+            try:
+                with index:
+                    index.executemany(
+                        'INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?)', updated)
+                    index.executemany('DELETE FROM hashes WHERE path = ?',
+                                      [(path,) for path in cached.keys() - seen])
+            except sqlite3.Error:
+                pass  # The cache is only an optimisation
+            finally:
+                index.close()
+
+    def _record_download(self, filepath, content_hash):
+        """Cache a saved image's digest so the next startup does not re-hash it"""
+        index = self._open_hash_index()
+        if index is None:
+            return
+        try:
+            stat = os.stat(filepath)
+            with index:
+                index.execute('INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?)',
+                              (os.path.basename(filepath), stat.st_size,
+                               stat.st_mtime_ns, content_hash))
+        except (OSError, sqlite3.Error):
+            pass  # The cache is only an optimisation
+        finally:
+            index.close()
 
     def _is_safe_content_type(self, content_type):
         """Check if the content type is a safe image format (Ubuntu: Respect & Security)"""
-        safe_types = [
-            'image/jpeg', 'image/jpg', 'image/png', 'image/gif',
-            'image/webp', 'image/bmp', 'image/svg+xml'
-        ]
-        return any(safe_type in content_type.lower() for safe_type in safe_types)
+        return content_type.split(';', 1)[0].strip().lower() in SAFE_CONTENT_TYPES
+
+    def _check_headers(self, content_type, content_length):
+        """Return an error message if the response headers rule the image out, else None"""
+        # Check if it's actually an image
+        if not self._is_safe_content_type(content_type):
+            return f"❌ Not a safe image type: {content_type}"
+
+        # Check file size (be respectful of bandwidth)
+        if content_length and int(content_length) > MAX_IMAGE_SIZE:
+            return "❌ File too large (>50MB). Being respectful of resources."
+        return None
 
-    def _get_file_extension(self, url, content_type):
+    def _get_file_extension(self, url_extension, content_type):
         """Determine appropriate file extension (Ubuntu: Practicality)"""
-        # First try to get extension from URL
-        parsed_url = urlparse(url)
-        filename = os.path.basename(parsed_url.path)
-        if '.' in filename:
-            return os.path.splitext(filename)[1]
+        # First try the extension from the URL's filename
+        if url_extension:
+            return url_extension
 
         # Fall back to content type
-        extension = mimetypes.guess_extension(content_type.split(';')[0])
-        return extension or '.jpg'
+        media_type = content_type.split(';', 1)[0].strip().lower()
+        return CONTENT_TYPE_EXTENSIONS.get(media_type, '.jpg')
 
     def _generate_filename(self, url, content_type, original_filename=None):
         """Generate appropriate filename (Ubuntu: Organization)"""
@@ -66,132 +410,433 @@ class UbuntuImageFetcher:
             return original_filename
 
         # Generate based on URL or timestamp
-        parsed_url = urlparse(url)
-        base_name = os.path.basename(parsed_url.path)
+        _, url_stem, url_extension = _parse_url(url)
+        base_name = url_stem or f"image_{int(time.time())}"
 
-        if not base_name or '.' not in base_name:
-            base_name = f"image_{int(time.time())}"
-        else:
-            base_name = os.path.splitext(base_name)[0]
-
-        extension = self._get_file_extension(url, content_type)
+        extension = self._get_file_extension(url_extension, content_type)
         return f"{base_name}{extension}"
 
-    def _check_duplicate(self, content):
+    def _check_duplicate(self, content_hash):
         """Check if image is duplicate using hash (Ubuntu: Sharing efficiently)"""
-        content_hash = hashlib.md5(content).hexdigest()
-        if content_hash in self.downloaded_hashes:
-            return True
-        self.downloaded_hashes.add(content_hash)
+        with self._lock:
+            if content_hash in self.downloaded_hashes:
+                return True
+            self.downloaded_hashes.add(content_hash)
         return False
 
+    def _save_download(self, download, url, content_type):
+        """
+        Move a finished _PartialDownload into place (Ubuntu: Preservation)
+        Returns: (success: bool, message: str, filepath: str or None)
+        """
+        duplicate = "⚠️  Image already exists (duplicate detected). Avoiding redundancy."
+        content_hash = download.finish()
+        temp_path = download.path
+
+        # Check for duplicates (Ubuntu: Sharing wisely)
+        if self._check_duplicate(content_hash):
+            return False, duplicate, None
+
+        # File the content under its digest; the link fails if another process beat us to it
+        object_path = self._object_path(content_hash)
+        linked = False
+        try:
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            os.link(temp_path, object_path)
+            linked = True
+        except FileExistsError:
+            return False, duplicate, None
+        except OSError:
+            pass  # No hard links on this filesystem; the in-memory check still applies
+
+        # Generate filename
+        filename = self._generate_filename(url, content_type)
+        filepath = os.path.join(self.directory, filename)
+
+        # Handle filename conflicts: O_EXCL claims a free name atomically, even across workers
+        name, ext = os.path.splitext(filepath)
+        for counter in itertools.count(1):
+            try:
+                os.close(os.open(filepath, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+                break
+            except FileExistsError:
+                filepath = f"{name}_{counter}{ext}"
+        try:
+            os.replace(temp_path, filepath)
+        except OSError:
+            # Undo every claim: the empty reservation would be hashed as an image next
+            # startup, and a remembered digest would turn a retry into a "duplicate"
+            os.remove(filepath)
+            if linked:
+                try:
+                    os.remove(object_path)
+                except OSError:
+                    pass  # Startup drops objects left with a single link
+            with self._lock:
+                self.downloaded_hashes.discard(content_hash)
+            raise
+        self._record_download(filepath, content_hash)
+
+        file_size = download.size / 1024  # Size in KB
+        return True, f"✅ Successfully saved: {os.path.basename(filepath)} ({file_size:.1f}KB)", filepath
+
+    def _host_slot(self, host):
+        """Get the semaphore limiting concurrent requests per host (Ubuntu: Respect)"""
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.Semaphore(self.max_per_host)
+                self._host_slots[host] = slot
+            return slot
+
+    def _host_delay(self, host):
+        """Book the next request slot for host; returns seconds to wait (Ubuntu: Respect)"""
+        with self._lock:
+            now = time.monotonic()
+            scheduled = max(now, self._host_next_request.get(host, now))
+            self._host_next_request[host] = scheduled + self.host_interval
+        return scheduled - now
+
+    def _wait_for_host(self, host):
+        """Keep requests to the same host at least host_interval apart (Ubuntu: Respect)"""
+        delay = self._host_delay(host)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _claim_idle_slots(self, host, wanted):
+        """Take up to wanted free per-host slots without waiting; returns how many were taken"""
+        slot = self._host_slot(host)
+        taken = 0
+        while taken < wanted and slot.acquire(blocking=False):
+            taken += 1
+        return taken
+
+    def _release_slots(self, host, count):
+        """Give back slots taken by _claim_idle_slots"""
+        slot = self._host_slot(host)
+        for _ in range(count):
+            slot.release()
+
+    def _fetch_ranges(self, url, host, total_size, parts):
+        """
+        Download a large image as parallel byte ranges (Ubuntu: Practicality)
+        The caller must hold one per-host slot for each part; every part is still spaced
+        host_interval apart like any other request to the host.
+        Returns: bytearray with the full content, or None if the server ignored the ranges
+        or answered any part for a different total size
+        """
+        content = bytearray(total_size)
+        view = memoryview(content)
+        step = -(-total_size // parts)
+        ranges = [(start, min(start + step, total_size))
+                  for start in range(0, total_size, step)]
+
+        def fetch_range(start, end):
+            self._wait_for_host(host)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True, headers={
+                'Range': f'bytes={start}-{end - 1}',
+                'Accept-Encoding': 'identity',
+            })
+            with response:
+                response.raise_for_status()
+                # Anything but exactly the bytes we asked for, out of the size we expect,
+                # would splice a different representation into the buffer
+                if (response.status_code != 206 or
+                        response.headers.get('content-encoding', 'identity') != 'identity' or
+                        response.headers.get('content-range') !=
+                        f'bytes {start}-{end - 1}/{total_size}'):
+                    return False
+                # http.client's readinto fills our slice in place; urllib3's readinto
+                # would read into a temporary bytes object and copy it over
+                readinto = getattr(getattr(response.raw, '_fp', None), 'readinto',
+                                   response.raw.readinto)
+                offset = start
+                while offset < end:
+                    # http.client reads bypass urllib3, so map its errors the same way
+                    try:
+                        size = readinto(view[offset:min(end, offset + 1024 * 1024)])
+                    except socket.timeout:
+                        raise requests.exceptions.ReadTimeout("Read timed out.")
+                    except (OSError, http.client.HTTPException) as e:
+                        raise requests.exceptions.ConnectionError(e)
+                    if not size:
+                        return False  # Short response
+                    offset += size
+                return True
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                complete = all(executor.map(lambda r: fetch_range(*r), ranges))
+        finally:
+            view.release()
+        return content if complete else None
+
+    def _splice_body(self, response, temp, length):
+        """
+        Move a plain-HTTP body from the socket into the temp file inside the kernel (Linux)
+        Returns: True if the body was written, False if this response can't be spliced
+        """
+        # Check the real socket, not the URL: an http:// URL through an https:// proxy is TLS
+        sock = getattr(response.raw.connection, 'sock', None)
+        # http.client's buffered reader holds any body bytes read along with the headers
+        reader = getattr(getattr(response.raw, '_fp', None), 'fp', None)
+        if (not SPLICE_SUPPORTED or not isinstance(sock, socket.socket) or
+                isinstance(sock, ssl.SSLSocket) or
+                response.headers.get('content-encoding', 'identity') != 'identity' or
+                'chunked' in response.headers.get('transfer-encoding', '').lower() or
+                not hasattr(reader, 'peek')):
+            return False  # TLS, compression or chunking must go through userland
+
+        sock_fd = sock.fileno()
+        # These reads bypass urllib3, so map socket errors the way it would
+        try:
+            buffered = reader.peek()[:length]
+            buffered = reader.read(len(buffered))
+        except socket.timeout:
+            response.close()
+            raise requests.exceptions.ReadTimeout("Read timed out.")
+        except OSError as e:
+            response.close()
+            raise requests.exceptions.ConnectionError(e)
+        temp.write(buffered)
+        temp.flush()
+        remaining = length - len(buffered)
+
+        # splice() needs a pipe on one side: socket -> pipe -> file
+        pipe_read, pipe_write = os.pipe()
+        try:
+            if hasattr(fcntl, 'F_SETPIPE_SZ'):
+                try:
+                    fcntl.fcntl(pipe_write, fcntl.F_SETPIPE_SZ, 1024 * 1024)
+                except OSError:
+                    pass  # Default 64KB pipe still works
+            poller = select.poll()
+            poller.register(sock_fd, select.POLLIN)
+            while remaining:
+                try:
+                    moved = os.splice(sock_fd, pipe_write, min(remaining, 1024 * 1024))
+                except BlockingIOError:
+                    # Socket has a timeout, so it is non-blocking underneath
+                    if not poller.poll(REQUEST_TIMEOUT[1] * 1000):
+                        raise requests.exceptions.ReadTimeout("Read timed out.")
+                    continue
+                except OSError as e:
+                    raise requests.exceptions.ConnectionError(e)  # e.g. connection reset
+                if not moved:
+                    raise requests.exceptions.ConnectionError("Connection closed mid-download.")
+                remaining -= moved
+                while moved:
+                    moved -= os.splice(pipe_read, temp.fileno(), moved)
+        finally:
+            os.close(pipe_read)
+            os.close(pipe_write)
+            response.close()  # urllib3 didn't see the body; never reuse this connection
+        return True
+
     def fetch_image(self, url):
         """
         Fetch a single image with Ubuntu principles
         Returns: (success: bool, message: str, filepath: str or None)
         """
+        # Every request counts against the host's limits (Ubuntu: Respect)
+        try:
+            host = _parse_url(url)[0].netloc
+        except ValueError as e:
+            return False, NETWORK_ERROR_MESSAGE.format(e), None  # e.g. an unclosed IPv6 bracket
+        with self._host_slot(host):
+            self._wait_for_host(host)
+            return self._fetch_image(url, host)
+
+    def _fetch_image(self, url, host):
+        """Body of fetch_image; the caller holds one of host's request slots"""
         try:
             print(f"🌐 Connecting to: {url}")
 
-            # First, make a HEAD request to check headers (Ubuntu: Respect)
-            try:
-                head_response = self.session.head(
-                    url, timeout=10, allow_redirects=True)
-                content_type = head_response.headers.get('content-type', '')
-                content_length = head_response.headers.get('content-length')
-
-                # Check if it's actually an image
-                if not self._is_safe_content_type(content_type):
-                    return False, f"❌ Not a safe image type: {content_type}", None
-
-                # Check file size (be respectful of bandwidth)
-                # 50MB limit
-                if content_length and int(content_length) > 50 * 1024 * 1024:
-                    return False, "❌ File too large (>50MB). Being respectful of resources.", None
-
-            except requests.exceptions.RequestException:
-                # If HEAD fails, continue with GET but be cautious
-                content_type = 'image/jpeg'  # Assume default
-
-            # Now fetch the actual image
-            response = self.session.get(url, timeout=30, stream=True)
+            # Fetch the image, checking headers before reading the body (Ubuntu: Respect)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True)
             response.raise_for_status()
-
-            # Update content type from actual response if needed
-            actual_content_type = response.headers.get(
-                'content-type', content_type)
-            if not self._is_safe_content_type(actual_content_type):
-                return False, f"❌ Response is not a safe image: {actual_content_type}", None
-
-            # Read content with size limit
-            content = b''
-            downloaded_size = 0
-            max_size = 50 * 1024 * 1024  # 50MB limit
-
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    downloaded_size += len(chunk)
-                    if downloaded_size > max_size:
-                        return False, "❌ File too large. Respecting bandwidth limits.", None
-                    content += chunk
-
-            # Check for duplicates (Ubuntu: Sharing wisely)
-            if self._check_duplicate(content):
-                return False, "⚠️  Image already exists (duplicate detected). Avoiding redundancy.", None
-
-            # Create directory (Ubuntu: Organization)
-            os.makedirs(self.directory, exist_ok=True)
-
-            # Generate filename
-            filename = self._generate_filename(url, actual_content_type)
-            filepath = os.path.join(self.directory, filename)
-
-            # Handle filename conflicts
-            counter = 1
-            original_filepath = filepath
-            while os.path.exists(filepath):
-                name, ext = os.path.splitext(original_filepath)
-                filepath = f"{name}_{counter}{ext}"
-                counter += 1
-
-            # Save the image (Ubuntu: Preservation)
-            with open(filepath, 'wb') as f:
-                f.write(content)
-
-            file_size = len(content) / 1024  # Size in KB
-            return True, f"✅ Successfully saved: {os.path.basename(filepath)} ({file_size:.1f}KB)", filepath
+            content_type = response.headers.get('content-type', '')
+            content_length = response.headers.get('content-length')
+            error = self._check_headers(content_type, content_length)
+            if error:
+                response.close()  # Never drain a body we don't want
+                return False, error, None
+
+            # Large images: fetch byte ranges in parallel when the server allows it.
+            # A compressed probe's length sizes the encoded body, not the image.
+            content = None
+            accept_ranges = response.headers.get(
+                'accept-ranges', '').lower() == 'bytes'
+            encoded = response.headers.get('content-encoding', 'identity') != 'identity'
+            if (accept_ranges and not encoded and content_length and
+                    int(content_length) > self.range_threshold):
+                # Our own slot covers one part; extra parts only use slots that are free now
+                extra_slots = self._claim_idle_slots(host, self.range_parts - 1)
+                if extra_slots:
+                    response.close()
+                    try:
+                        content = self._fetch_ranges(
+                            url, host, int(content_length), extra_slots + 1)
+                    finally:
+                        self._release_slots(host, extra_slots)
+                    if content is None:
+                        # Server ignored the ranges; fall back to a plain download
+                        self._wait_for_host(host)
+                        response = self.session.get(
+                            url, timeout=REQUEST_TIMEOUT, stream=True)
+                        response.raise_for_status()
+                        content_type = response.headers.get('content-type', '')
+                        content_length = response.headers.get('content-length')
+                        error = self._check_headers(content_type, content_length)
+                        if error:
+                            response.close()
+                            return False, error, None
+
+            # Stream to a temporary file, hashing as we go (one pass, bounded memory)
+            download = _PartialDownload(self.directory)
+            try:
+                if content is not None:
+                    # Hash and write each slice while it is still hot in cache
+                    with memoryview(content) as view:
+                        for offset in range(0, len(view), 65536):
+                            download.write(view[offset:offset + 65536])
+                elif content_length and self._splice_body(
+                        response, download.file, int(content_length)):
+                    download.spliced(int(content_length))
+                else:
+                    for chunk in response.iter_content(
+                            chunk_size=_chunk_size(content_length)):
+                        if chunk and not download.write(chunk):
+                            response.close()
+                            return False, TOO_LARGE_MESSAGE, None
+
+                return self._save_download(download, url, content_type)
+            finally:
+                download.discard()
 
         except requests.exceptions.Timeout:
-            return False, "⏱️  Connection timeout. Server may be busy - respecting their resources.", None
+            return False, TIMEOUT_MESSAGE, None
         except requests.exceptions.ConnectionError:
-            return False, "🔌 Connection failed. Network or server unavailable.", None
+            return False, CONNECTION_MESSAGE, None
         except requests.exceptions.HTTPError as e:
-            return False, f"🚫 HTTP Error {e.response.status_code}: Server declined request.", None
+            return False, HTTP_ERROR_MESSAGE.format(e.response.status_code), None
         except requests.exceptions.RequestException as e:
-            return False, f"🌐 Network error: {str(e)}", None
+            return False, NETWORK_ERROR_MESSAGE.format(e), None
         except Exception as e:
-            return False, f"❌ Unexpected error: {str(e)}", None
+            return False, UNEXPECTED_ERROR_MESSAGE.format(e), None
 
     def fetch_multiple_images(self, urls):
         """
         Fetch multiple images (Challenge Question 1)
         Ubuntu: Building community through batch operations
         """
-        results = []
+        results = [None] * len(urls)
         print(f"\n🔄 Processing {len(urls)} images with Ubuntu spirit...\n")
 
-        for i, url in enumerate(urls, 1):
-            print(f"[{i}/{len(urls)}] ", end="")
-            success, message, filepath = self.fetch_image(url.strip())
-            results.append((url, success, message, filepath))
-            print(message)
-
-            # Be respectful - small delay between requests
-            if i < len(urls):
-                time.sleep(0.5)
+        # Fetch in parallel; per-host limits keep each server's load polite
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch_image, url.strip()): i
+                for i, url in enumerate(urls)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                success, message, filepath = future.result()
+                results[i] = (urls[i], success, message, filepath)
+                print(f"[{done}/{len(urls)}] {message}")
 
         return results
 
+    async def _fetch_image_async(self, session, url):
+        """
+        Fetch a single image on the event loop (same checks as fetch_image)
+        Returns: (success: bool, message: str, filepath: str or None)
+        """
+        # File writes, hashing and the save block, so they run on the default executor
+        loop = asyncio.get_running_loop()
+        try:
+            print(f"🌐 Connecting to: {url}")
+
+            async with session.get(url) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('content-type', '')
+                content_length = response.headers.get('content-length')
+                error = self._check_headers(content_type, content_length)
+                if error:
+                    return False, error, None  # Leaving the block drops the unread body
+
+                # Stream to a temporary file, hashing as we go
+                download = await loop.run_in_executor(
+                    None, _PartialDownload, self.directory)
+                try:
+                    async for chunk in response.content.iter_chunked(
+                            _chunk_size(content_length)):
+                        if not await loop.run_in_executor(None, download.write, chunk):
+                            return False, TOO_LARGE_MESSAGE, None
+
+                    return await loop.run_in_executor(
+                        None, self._save_download, download, url, content_type)
+                finally:
+                    await loop.run_in_executor(None, download.discard)
+
+        except asyncio.TimeoutError:
+            return False, TIMEOUT_MESSAGE, None
+        except aiohttp.ClientResponseError as e:
+            return False, HTTP_ERROR_MESSAGE.format(e.status), None
+        except aiohttp.ClientConnectionError:
+            return False, CONNECTION_MESSAGE, None
+        except aiohttp.ClientError as e:
+            return False, NETWORK_ERROR_MESSAGE.format(e), None
+        except Exception as e:
+            return False, UNEXPECTED_ERROR_MESSAGE.format(e), None
+
+    async def fetch_many_async(self, urls, limit=64):
+        """
+        Fetch many images concurrently on one asyncio event loop (requires aiohttp)
+        Returns: list of (url, success, message, filepath) in input order
+        """
+        if aiohttp is None:
+            raise RuntimeError("fetch_many requires aiohttp: pip install aiohttp")
+        connector = aiohttp.TCPConnector(
+            limit=limit, limit_per_host=self.max_per_host, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=REQUEST_TIMEOUT[0], sock_read=REQUEST_TIMEOUT[1])
+        host_slots = {}
+        done = 0
+        print(f"\n🔄 Processing {len(urls)} images with Ubuntu spirit...\n")
+
+        async with aiohttp.ClientSession(
+                connector=connector, timeout=timeout,
+                headers={'User-Agent': self.session.headers['User-Agent']}) as session:
+            async def fetch_one(url):
+                nonlocal done
+                target = url.strip()
+                try:
+                    host = _parse_url(target)[0].netloc
+                except ValueError as e:
+                    success, message, filepath = False, NETWORK_ERROR_MESSAGE.format(e), None
+                else:
+                    slot = host_slots.setdefault(
+                        host, asyncio.Semaphore(self.max_per_host))
+                    async with slot:
+                        delay = self._host_delay(host)
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                        success, message, filepath = await self._fetch_image_async(
+                            session, target)
+                done += 1
+                print(f"[{done}/{len(urls)}] {message}")
+                return url, success, message, filepath
+
+            return list(await asyncio.gather(*(fetch_one(url) for url in urls)))
+
+    def fetch_many(self, urls, limit=64):
+        """
+        Fetch many images with asyncio instead of threads - suits lists of hundreds of URLs
+        Ubuntu: Building community at scale
+        """
+        return asyncio.run(self.fetch_many_async(urls, limit))
+
     def display_summary(self, results):
         """Display a summary of operations (Ubuntu: Sharing results)"""
         successful = sum(1 for _, success, _, _ in results if success)